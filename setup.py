@@ -23,6 +23,9 @@ setup(
         "setuptools>=45.0",
         "minimalmodbus>=2.0.1",
     ],
+    extras_require={
+        "async": ["pyserial-asyncio>=0.6"],
+    },
     classifiers=[
         "Development Status :: 1 - Planning",
         "Programming Language :: Python :: 3.0",
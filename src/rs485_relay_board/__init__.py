@@ -1,5 +1,6 @@
-from rs485_relay_board.base import RelayBoard
+from rs485_relay_board.async_board import ProcessRelayBoard
+from rs485_relay_board.base import RelayBoard, read_all_boards
 from rs485_relay_board.version import __version__
 
 
-__all__ = ["RelayBoard", "__version__"]
+__all__ = ["ProcessRelayBoard", "RelayBoard", "read_all_boards", "__version__"]
@@ -0,0 +1,328 @@
+import asyncio
+import time
+from typing import List, Optional, Tuple
+
+import serial_asyncio
+from minimalmodbus import InvalidResponseError, NoResponseError, SlaveReportedException
+
+from rs485_relay_board import rtu
+from rs485_relay_board.base import (
+    _CLOSE,
+    _CLOSE_ALL,
+    _DELAY_VALUES,
+    _LATCH,
+    _MIN_SILENT_INTERVAL,
+    _MOMENTARY,
+    _OPEN,
+    _OPEN_ALL,
+    _TOGGLE,
+)
+
+
+class AsyncRelayBoard:
+    """
+    asyncio variant of `RelayBoard`, frames Modbus RTU requests itself on top of `pyserial-asyncio`.
+
+    The event loop is free while waiting for the response of the board.
+    Requires the `async` extra (`pip install rs485-relay-board[async]`).
+
+    Use `await board.connect()` or `async with AsyncRelayBoard(...) as board:` before sending commands.
+    """
+
+    channels: int
+
+    def __init__(
+        self,
+        port: str,
+        slaveaddress: int,
+        channels: int = 16,
+        baudrate: int = 9600,
+        read_timeout: float = 0.2,
+    ):
+        """
+        Setup relay board.
+
+        :param port: The serial port name, for example `/dev/ttyUSB0` (Linux),
+                     `/dev/tty.usbserial` (OS X) or `COM4` (Windows).
+        :param slaveaddress: Slave address in the range 0 to 247 (use decimal numbers, not hex).
+        :param channels: Number of channels of the relay board.
+        :param baudrate: Baudrate to use.
+        :param read_timeout: Read timeout after each command.
+        """
+        self.port = port
+        self.slaveaddress = slaveaddress
+        self.channels = channels
+        self.baudrate = baudrate
+        self.read_timeout = read_timeout
+
+        # 8N1 framing, 10 bits per byte.
+        self._silent_3_5 = max(3.5 * 10 / baudrate, _MIN_SILENT_INTERVAL)
+        self._last_io = 0.0
+        # Set when a transaction failed, late or partial responses may still be buffered.
+        self._dirty = False
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def connect(self):
+        """
+        Open the serial port.
+        """
+        self._reader, self._writer = await serial_asyncio.open_serial_connection(
+            url=self.port, baudrate=self.baudrate
+        )
+        self._lock = asyncio.Lock()
+
+    async def close(self):
+        """
+        Close the serial port.
+        """
+        if self._writer is None:
+            return
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._reader = self._writer = None
+
+    async def __aenter__(self) -> "AsyncRelayBoard":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def check_channel_number(self, channel: int):
+        """
+        Check if channel number is between 1 and `self.channels`.
+
+        :param channel: Number of channel.
+        :raise ValueError:
+        """
+        if not (1 <= channel <= self.channels):
+            raise ValueError("Invalid number of channel.")
+
+    def check_seconds(self, seconds: int):
+        """
+        Check if seconds is between 0 and 255.
+
+        :param seconds: Whole number of seconds
+        """
+        if not (0 <= seconds < len(_DELAY_VALUES)):
+            raise ValueError("Delay can be only in range 0-255 seconds")
+
+    async def _transact(self, request: bytes, response_bytes: int) -> bytes:
+        """
+        Send request and read the response of the board.
+
+        :param request: Complete request frame.
+        :param response_bytes: Expected length of the response frame in bytes.
+        :return: Complete response frame.
+        :raise NoResponseError: If the board does not answer in `self.read_timeout`.
+        :raise SlaveReportedException: If the board answers with an exception response.
+        """
+        if self._writer is None:
+            raise RuntimeError("Not connected, call connect() first.")
+        async with self._lock:
+            # Every failed transaction leaves the board dirty, late replies are dropped here.
+            if self._dirty:
+                await self._discard_input()
+            else:
+                remaining = self._silent_3_5 - (time.monotonic() - self._last_io)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+            loop = asyncio.get_running_loop()
+            self._dirty = True
+            self._writer.write(request)
+            try:
+                await self._writer.drain()
+                # One deadline for the whole response.
+                deadline = loop.time() + self.read_timeout
+                # Exception responses are 5 bytes long, read those first.
+                response = await asyncio.wait_for(
+                    self._reader.readexactly(5), deadline - loop.time()
+                )
+                if response[0] != request[0] or response[1] & 0x7F != request[1]:
+                    raise InvalidResponseError(
+                        f"Unexpected header of the response: {response!r}"
+                    )
+                if response[1] & 0x80:
+                    if not rtu.check_crc(response):
+                        raise InvalidResponseError("Invalid CRC of the response.")
+                    self._dirty = False
+                    raise SlaveReportedException(
+                        f"Board reported exception code {response[2]}"
+                    )
+                response += await asyncio.wait_for(
+                    self._reader.readexactly(response_bytes - 5),
+                    max(deadline - loop.time(), 0.0),
+                )
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                raise NoResponseError("No complete response from the board.") from e
+            finally:
+                self._last_io = time.monotonic()
+            self._dirty = False
+        return response
+
+    async def _discard_input(self):
+        """
+        Drop late or partial responses of a failed transaction.
+
+        Reads and discards everything until the line is silent for 3.5 characters,
+        so the next request does not collide with the tail of a late response.
+        """
+        while True:
+            try:
+                data = await asyncio.wait_for(
+                    self._reader.read(256), max(self._silent_3_5, 0.001)
+                )
+            except asyncio.TimeoutError:
+                break
+            if not data:
+                break
+        self._last_io = time.monotonic()
+        self._dirty = False
+
+    async def _write_register(self, address: int, value: int):
+        """
+        Write single register (function code 6) and check the echo.
+
+        :param address: Number of channel, 0 for all channels.
+        :param value: Command value.
+        """
+        request = rtu.write_register_frame(self.slaveaddress, address, value)
+        if await self._transact(request, len(request)) != request:
+            self._dirty = True
+            raise InvalidResponseError("Response is not an echo of the request.")
+
+    async def _read_registers(self, address: int, count: int) -> List[int]:
+        """
+        Read holding registers (function code 3).
+
+        :param address: Address of the first register.
+        :param count: Number of registers.
+        :return: List of register values.
+        """
+        request = rtu.read_registers_frame(self.slaveaddress, address, count)
+        response = await self._transact(request, 5 + 2 * count)
+        try:
+            return rtu.parse_read_registers_response(self.slaveaddress, count, response)
+        except ValueError as e:
+            self._dirty = True
+            raise InvalidResponseError(str(e)) from e
+
+    async def open_relay(self, channel: int):
+        """
+        Open relay.
+
+        :param channel: Number of channel.
+        """
+        self.check_channel_number(channel)
+        await self._write_register(channel, _OPEN)
+
+    async def close_relay(self, channel: int):
+        """
+        Close relay
+
+        :param channel: Number of channel.
+        """
+        self.check_channel_number(channel)
+        await self._write_register(channel, _CLOSE)
+
+    async def set_relay(self, channel: int, state: bool):
+        """
+        Set state of given relay.
+
+        True means "Open" / High to relay state.
+
+        :param channel: Number of channel.
+        :param state: Bool state
+        """
+        self.check_channel_number(channel)
+        await self._write_register(channel, _OPEN if state else _CLOSE)
+
+    async def toggle(self, channel: int):
+        """
+        Toggle (Self-locking) relay
+
+        :param channel: Number of channel.
+        """
+        self.check_channel_number(channel)
+        await self._write_register(channel, _TOGGLE)
+
+    async def latch(self, channel: int):
+        """
+        Latch (Inter-locking) relay
+
+        :param channel: Number of channel.
+        """
+        self.check_channel_number(channel)
+        await self._write_register(channel, _LATCH)
+
+    async def momentary(self, channel: int):
+        """
+        Momentary (Non-locking).
+
+        Close relay for 1s.
+
+        :param channel: Number of channel.
+        """
+        self.check_channel_number(channel)
+        await self._write_register(channel, _MOMENTARY)
+
+    async def delay(self, channel: int, seconds: int):
+        """
+        Delay
+
+        Open relay for <seconds>s.
+
+        :param channel: Number of channel.
+        :param seconds: Number of seconds to close the relay for
+        """
+        self.check_channel_number(channel)
+        self.check_seconds(seconds)
+        await self._write_register(channel, _DELAY_VALUES[seconds])
+
+    async def open_all(self):
+        """
+        Open all relays.
+        """
+        await self._write_register(0, _OPEN_ALL)
+
+    async def close_all(self):
+        """
+        Close all relays.
+        """
+        await self._write_register(0, _CLOSE_ALL)
+
+    async def read_relay(self, channel: int) -> bool:
+        """
+        Read state of a relay.
+
+        True means "Open" / High to relay state.
+
+        :param channel: Number of channel.
+        :return: Bool
+        """
+        self.check_channel_number(channel)
+        return 1 == (await self._read_registers(channel, 1))[0]
+
+    async def read_relays(self, start_channel: int, length: int) -> Tuple[bool]:
+        """
+        Read state of n relays.
+
+        :param start_channel: Number of channel to start reading from.
+        :param length: Number of relays to read.
+        :return: Tuple of booleans of length n(length).
+        """
+        self.check_channel_number(start_channel)
+        if self.channels - start_channel + 1 < length:
+            raise ValueError("Invalid length.")
+        registers = await self._read_registers(start_channel, length)
+        return tuple([1 == x for x in registers])
+
+    async def read_all_relays(self) -> Tuple[bool]:
+        """
+        Read state of all relays.
+
+        :return: Tuple of booleans of length `self.channels`.
+        """
+        return await self.read_relays(1, self.channels)
@@ -0,0 +1,395 @@
+import itertools
+import logging
+import multiprocessing
+import pickle
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+from rs485_relay_board.base import RelayBoard
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks that the worker process is still alive.
+_LIVENESS_INTERVAL = 0.5
+
+
+def _respond(resp_q, request_id: int, ok: bool, value: Any):
+    """
+    Put result to `resp_q`, replacing values that can not be sent between processes.
+
+    :param resp_q: Queue of results.
+    :param request_id: Id of the command.
+    :param ok: If the command succeeded.
+    :param value: Result or exception of the command.
+    """
+    try:
+        pickle.dumps(value)
+    except Exception as e:
+        ok, value = False, RuntimeError(f"Result of the command can not be sent: {e!r}")
+    resp_q.put((request_id, ok, value))
+
+
+def _resolve(future: Future, ok: bool, value: Any):
+    """
+    Resolve future with result or exception, unless the caller cancelled it.
+
+    :param future: Future of the command.
+    :param ok: If the command succeeded.
+    :param value: Result or exception of the command.
+    """
+    if not future.set_running_or_notify_cancel():
+        return
+    if ok:
+        future.set_result(value)
+    else:
+        future.set_exception(value)
+
+
+def _worker(board_kwargs: Dict[str, Any], cmd_q, resp_q):
+    """
+    Body of the worker process, owns the `RelayBoard` and runs commands from `cmd_q`.
+
+    Commands are `(request_id, method_name, args)` tuples, `None` stops the worker.
+    Results are put to `resp_q` as `(request_id, ok, result_or_exception)`,
+    commands with `request_id` `None` are not answered.
+
+    :param board_kwargs: Keyword arguments for `RelayBoard`.
+    :param cmd_q: Queue of commands.
+    :param resp_q: Queue of results.
+    """
+    try:
+        board = RelayBoard(**board_kwargs)
+    except Exception as e:
+        _respond(resp_q, 0, False, e)
+        return
+    resp_q.put((0, True, None))
+
+    while True:
+        command = cmd_q.get()
+        if command is None:
+            break
+        request_id, method, args = command
+        try:
+            result = getattr(board, method)(*args)
+        except Exception as e:
+            if request_id is None:
+                logger.error("Command %s%r failed", method, args, exc_info=True)
+            else:
+                _respond(resp_q, request_id, False, e)
+        else:
+            if request_id is not None:
+                _respond(resp_q, request_id, True, result)
+    board.close()
+
+
+class ProcessRelayBoard:
+    """
+    Relay board driven from a separate process.
+
+    The worker process owns the serial port and the `RelayBoard`, so blocking Modbus
+    transactions never hold the GIL of the calling process.
+
+    Commands return immediately when `fire_and_forget` is `True`, errors are then only
+    logged by the worker process. Reads return a `concurrent.futures.Future`.
+
+    Channel numbers are checked in the calling process, so invalid arguments raise
+    `ValueError` right away.
+    """
+
+    channels: int
+
+    def __init__(
+        self,
+        port: str,
+        slaveaddress: int,
+        channels: int = 16,
+        baudrate: int = 9600,
+        read_timeout: float = 0.2,
+        close_port_after_each_call: bool = False,
+        debug: bool = False,
+        cache_ttl: float = 0.0,
+        adaptive_timeout: Optional[float] = None,
+        fire_and_forget: bool = True,
+    ):
+        """
+        Start the worker process and setup relay board in it.
+
+        :param port: The serial port name, for example `/dev/ttyUSB0` (Linux),
+                     `/dev/tty.usbserial` (OS X) or `COM4` (Windows).
+        :param slaveaddress: Slave address in the range 0 to 247 (use decimal numbers, not hex).
+        :param channels: Number of channels of the relay board.
+        :param baudrate: Baudrate to use.
+        :param read_timeout: Read timeout after each command.
+        :param close_port_after_each_call: If the serial port should be closed after each call to the board.
+        :param debug: Set this to `True` to print the communication details
+        :param cache_ttl: See `RelayBoard`.
+        :param adaptive_timeout: See `RelayBoard`.
+        :param fire_and_forget: If commands should return without waiting for the board.
+        :raise: Any exception raised by `RelayBoard` in the worker process.
+        """
+        self.channels = channels
+        self.fire_and_forget = fire_and_forget
+
+        self._ids = itertools.count(1)
+        # Set once the worker is gone, no further commands are accepted.
+        self._stopped = False
+        self._futures: Dict[int, Future] = {0: Future()}
+        self._cmd_q = multiprocessing.Queue()
+        self._resp_q = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_worker,
+            args=(
+                {
+                    "port": port,
+                    "slaveaddress": slaveaddress,
+                    "channels": channels,
+                    "baudrate": baudrate,
+                    "read_timeout": read_timeout,
+                    "close_port_after_each_call": close_port_after_each_call,
+                    "debug": debug,
+                    "cache_ttl": cache_ttl,
+                    "adaptive_timeout": adaptive_timeout,
+                },
+                self._cmd_q,
+                self._resp_q,
+            ),
+            name="RelayBoardWorker",
+            daemon=True,
+        )
+        self._process.start()
+        self._dispatcher = threading.Thread(
+            target=self._dispatch, name="RelayBoardDispatcher", daemon=True
+        )
+        self._dispatcher.start()
+
+        try:
+            self._futures[0].result()
+        except Exception:
+            self.close()
+            raise
+
+    def _dispatch(self):
+        """
+        Body of the dispatcher thread, resolves futures with results from the worker.
+        """
+        while True:
+            try:
+                response = self._resp_q.get(timeout=_LIVENESS_INTERVAL)
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+                self._fail_pending(
+                    RuntimeError(
+                        f"Worker process exited with code {self._process.exitcode}."
+                    )
+                )
+                break
+            if response is None:
+                break
+            request_id, ok, value = response
+            future = self._futures.pop(request_id, None)
+            if future is not None:
+                _resolve(future, ok, value)
+
+    def _fail_pending(self, exception: Exception):
+        """
+        Stop accepting commands and fail all futures still waiting for the worker.
+
+        :param exception: Exception to set on the futures.
+        """
+        self._stopped = True
+        for request_id in list(self._futures):
+            future = self._futures.pop(request_id, None)
+            if future is not None:
+                _resolve(future, False, exception)
+
+    def _call(self, method: str, *args) -> Future:
+        """
+        Run method of `RelayBoard` in the worker process.
+
+        :param method: Name of the method.
+        :param args: Positional arguments of the method.
+        :return: Future resolved with the result of the method.
+        """
+        if self._stopped:
+            raise RuntimeError("Worker process is not running.")
+        request_id = next(self._ids)
+        future = Future()
+        self._futures[request_id] = future
+        self._cmd_q.put((request_id, method, args))
+        if self._stopped:
+            # The worker went away meanwhile, fail the future unless the dispatcher did.
+            if self._futures.pop(request_id, None) is not None:
+                _resolve(future, False, RuntimeError("Worker process is not running."))
+        return future
+
+    def _command(self, method: str, *args):
+        """
+        Run command method of `RelayBoard`, waiting for it unless `fire_and_forget` is set.
+
+        :param method: Name of the method.
+        :param args: Positional arguments of the method.
+        """
+        if self.fire_and_forget:
+            if self._stopped:
+                raise RuntimeError("Worker process is not running.")
+            self._cmd_q.put((None, method, args))
+        else:
+            self._call(method, *args).result()
+
+    def check_channel_number(self, channel: int):
+        """
+        Check if channel number is between 1 and `self.channels`.
+
+        :param channel: Number of channel.
+        :raise ValueError:
+        """
+        if not (1 <= channel <= self.channels):
+            raise ValueError("Invalid number of channel.")
+
+    def open_relay(self, channel: int):
+        """
+        Open relay.
+
+        :param channel: Number of channel.
+        """
+        self.check_channel_number(channel)
+        self._command("open_relay", channel)
+
+    def close_relay(self, channel: int):
+        """
+        Close relay
+
+        :param channel: Number of channel.
+        """
+        self.check_channel_number(channel)
+        self._command("close_relay", channel)
+
+    def set_relay(self, channel: int, state: bool):
+        """
+        Set state of given relay.
+
+        True means "Open" / High to relay state.
+
+        :param channel: Number of channel.
+        :param state: Bool state
+        """
+        self.check_channel_number(channel)
+        self._command("set_relay", channel, state)
+
+    def set_relays(self, states: Dict[int, bool]):
+        """
+        Set state of multiple relays at once.
+
+        :param states: Dictionary mapping number of channel to bool state.
+        """
+        if states and not (1 <= min(states) and max(states) <= self.channels):
+            raise ValueError("Invalid number of channel.")
+        self._command("set_relays", states)
+
+    def toggle(self, channel: int):
+        """
+        Toggle (Self-locking) relay
+
+        :param channel: Number of channel.
+        """
+        self.check_channel_number(channel)
+        self._command("toggle", channel)
+
+    def latch(self, channel: int):
+        """
+        Latch (Inter-locking) relay
+
+        :param channel: Number of channel.
+        """
+        self.check_channel_number(channel)
+        self._command("latch", channel)
+
+    def momentary(self, channel: int):
+        """
+        Momentary (Non-locking).
+
+        Close relay for 1s.
+
+        :param channel: Number of channel.
+        """
+        self.check_channel_number(channel)
+        self._command("momentary", channel)
+
+    def delay(self, channel: int, seconds: int):
+        """
+        Delay
+
+        Open relay for <seconds>s.
+
+        :param channel: Number of channel.
+        :param seconds: Number of seconds to close the relay for
+        """
+        self.check_channel_number(channel)
+        if not (0 <= seconds <= 255):
+            raise ValueError("Delay can be only in range 0-255 seconds")
+        self._command("delay", channel, seconds)
+
+    def open_all(self):
+        """
+        Open all relays.
+        """
+        self._command("open_all")
+
+    def close_all(self):
+        """
+        Close all relays.
+        """
+        self._command("close_all")
+
+    def read_relay(self, channel: int) -> "Future[bool]":
+        """
+        Read state of a relay.
+
+        :param channel: Number of channel.
+        :return: Future resolved with bool state.
+        """
+        self.check_channel_number(channel)
+        return self._call("read_relay", channel)
+
+    def read_relays(self, start_channel: int, length: int) -> "Future[Tuple[bool]]":
+        """
+        Read state of n relays.
+
+        :param start_channel: Number of channel to start reading from.
+        :param length: Number of relays to read.
+        :return: Future resolved with tuple of booleans of length n(length).
+        """
+        self.check_channel_number(start_channel)
+        if self.channels - start_channel + 1 < length:
+            raise ValueError("Invalid length.")
+        return self._call("read_relays", start_channel, length)
+
+    def read_all_relays(self) -> "Future[Tuple[bool]]":
+        """
+        Read state of all relays.
+
+        :return: Future resolved with tuple of booleans of length `self.channels`.
+        """
+        return self._call("read_all_relays")
+
+    def close(self):
+        """
+        Stop the worker process after it finishes all queued commands and release the serial port.
+        """
+        if self._process.is_alive():
+            self._cmd_q.put(None)
+            self._process.join()
+        if self._dispatcher.is_alive():
+            self._resp_q.put(None)
+            self._dispatcher.join()
+        self._fail_pending(RuntimeError("Board is closed."))
+
+    def __enter__(self) -> "ProcessRelayBoard":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
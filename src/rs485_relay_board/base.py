@@ -1,11 +1,107 @@
 import logging
-from typing import Tuple
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
-from minimalmodbus import Instrument
+from minimalmodbus import (
+    Instrument,
+    InvalidResponseError,
+    NoResponseError,
+    SlaveReportedException,
+)
+
+from rs485_relay_board import rtu
 
 
 logger = logging.getLogger(__name__)
 
+# Command values written to the register of a channel (0 means all channels).
+_ACTION = {
+    "open": 0x0100,
+    "close": 0x0200,
+    "toggle": 0x0300,
+    "latch": 0x0400,
+    "momentary": 0x0500,
+    "delay": 0x0600,
+    "open_all": 0x0700,
+    "close_all": 0x0800,
+}
+_OPEN = _ACTION["open"]
+_CLOSE = _ACTION["close"]
+_TOGGLE = _ACTION["toggle"]
+_LATCH = _ACTION["latch"]
+_MOMENTARY = _ACTION["momentary"]
+_OPEN_ALL = _ACTION["open_all"]
+_CLOSE_ALL = _ACTION["close_all"]
+# Delay command value for every valid number of seconds (0-255).
+_DELAY_VALUES = tuple(_ACTION["delay"] | seconds for seconds in range(256))
+
+# Modbus RTU fixes the 3.5 character silent interval to 1.75 ms above 19200 baud.
+_MIN_SILENT_INTERVAL = 0.00175
+
+_INVALID_CHANNEL = "Invalid number of channel."
+_INVALID_SECONDS = "Delay can be only in range 0-255 seconds"
+
+# Read-only constant parts of the `extra` passed to log records, merged with the channel on emit.
+_ACTION_EXTRAS: Dict[str, Mapping[str, Any]] = {
+    "open": MappingProxyType({"state": True, "action": "open"}),
+    "close": MappingProxyType({"state": False, "action": "close"}),
+    "toggle": MappingProxyType({"state": None, "action": "toggle"}),
+    "latch": MappingProxyType({"state": None, "action": "latch"}),
+    "momentary": MappingProxyType(
+        {"state": True, "action": "momentary_close", "time": 1}
+    ),
+    "delay": MappingProxyType({"state": True, "action": "delay_close"}),
+    "multi_set": MappingProxyType(
+        {"channel": -3, "state": None, "action": "multi_set"}
+    ),
+    "open_all": MappingProxyType({"channel": -1, "state": True, "action": "all_open"}),
+    "close_all": MappingProxyType(
+        {"channel": -1, "state": False, "action": "all_close"}
+    ),
+    "read": MappingProxyType({"state": False, "action": "read"}),
+    "more_read": MappingProxyType(
+        {"channel": "-2", "state": False, "action": "more_read"}
+    ),
+    "sequence": MappingProxyType({"channel": -4, "state": None, "action": "sequence"}),
+}
+
+
+class _PortState:
+    """
+    State shared by all boards on one serial port.
+    """
+
+    __slots__ = ("lock", "last_io")
+
+    def __init__(self):
+        # Serializes transactions of all boards and polling threads on the port.
+        self.lock = threading.Lock()
+        # Monotonic time the last transaction on the port ended, for the RTU silent interval.
+        self.last_io = 0.0
+
+
+# Keyed by the `Serial` minimalmodbus shares between instruments on one port name.
+_PORTS: "weakref.WeakKeyDictionary[Any, _PortState]" = weakref.WeakKeyDictionary()
+_PORTS_LOCK = threading.Lock()
+
+
+def _port_state(serial: Any) -> _PortState:
+    """
+    Get state shared by all boards using the serial port.
+
+    :param serial: Serial port of the instrument.
+    :return: State of the port.
+    """
+    with _PORTS_LOCK:
+        state = _PORTS.get(serial)
+        if state is None:
+            state = _PORTS[serial] = _PortState()
+        return state
+
 
 class RelayBoard:
     """
@@ -18,8 +114,34 @@ class RelayBoard:
 
     e.g. Open = HIGH to relay, Closed = LOW to relay
 
+    Attributes are declared in `__slots__`, subclasses without `__slots__` get a `__dict__` as usual.
     """
 
+    __slots__ = (
+        "board",
+        "channels",
+        "_channel_range",
+        "_setters",
+        "_write",
+        "_read",
+        "_read_many",
+        "_ser",
+        "_byte_time",
+        "_silent_3_5",
+        "_read_timeout",
+        "_timeout_margin",
+        "_cache_ttl",
+        "_cache",
+        "_port",
+        "_lock",
+        "_poll_thread",
+        "_poll_stop",
+        "_snapshot",
+        "_last_registers",
+        "_last_state",
+        "__weakref__",
+    )
+
     board: Instrument
     channels: int
 
@@ -32,6 +154,8 @@ class RelayBoard:
         read_timeout: float = 0.2,
         close_port_after_each_call: bool = False,
         debug: bool = False,
+        cache_ttl: float = 0.0,
+        adaptive_timeout: Optional[float] = None,
     ):
         """
         Setup relay board.
@@ -43,7 +167,16 @@ class RelayBoard:
         :param baudrate: Baudrate to use.
         :param read_timeout: Read timeout after each command.
         :param close_port_after_each_call: If the serial port should be closed after each call to the board.
+                                           Reopening the port on every call is slow, prefer keeping
+                                           it open and releasing it with `close()` or a `with` block.
         :param debug: Set this to `True` to print the communication details
+        :param cache_ttl: Number of seconds the last read state of all relays is reused for.
+                          The cache is dropped on every command sent to the board.
+                          `0` disables the cache.
+        :param adaptive_timeout: If set, the read timeout is computed for each call from the
+                                 request and expected response lengths and the baudrate, plus
+                                 this margin in seconds for the board to process the request.
+                                 Overrides `read_timeout`.
         """
 
         self.board = Instrument(
@@ -54,18 +187,46 @@ class RelayBoard:
         )
         self.board.serial.baudrate = baudrate
         self.board.serial.timeout = read_timeout
+        self._write = self.board.write_register
+        self._read = self.board.read_register
+        self._read_many = self.board.read_registers
+        self._ser = self.board.serial
+
+        serial = self.board.serial
+        bits_per_byte = 1 + serial.bytesize + serial.stopbits + (serial.parity != "N")
+        self._byte_time = bits_per_byte / baudrate
+        self._silent_3_5 = max(3.5 * self._byte_time, _MIN_SILENT_INTERVAL)
+        self._read_timeout = read_timeout
+        self._timeout_margin = adaptive_timeout
 
         self.channels = channels
+        self._channel_range = range(1, channels + 1)
+        # Indexed by bool state in `set_relay`.
+        self._setters = (self.close_relay, self.open_relay)
+
+        self._cache_ttl = cache_ttl
+        self._cache: Optional[Tuple[float, Tuple[bool, ...]]] = None
+
+        # Shared with other boards on the same port, so their transactions never interleave.
+        self._port = _port_state(self.board.serial)
+        self._lock = self._port.lock
+        self._poll_thread: Optional[threading.Thread] = None
+        self._poll_stop = threading.Event()
+        self._snapshot: Optional[Tuple[bool, ...]] = None
+        self._last_registers: Optional[List[int]] = None
+        self._last_state: Tuple[bool, ...] = ()
 
     def check_channel_number(self, channel: int):
         """
-        Check if channel number is between 1 and `self.channels`.
+        Check if channel number is an integer between 1 and `self.channels`.
+
+        Command methods inline this check to save a method call.
 
         :param channel: Number of channel.
         :raise ValueError:
         """
-        if not (1 <= channel <= self.channels):
-            raise ValueError("Invalid number of channel.")
+        if not isinstance(channel, int) or channel not in self._channel_range:
+            raise ValueError(_INVALID_CHANNEL)
 
     def check_seconds(self, seconds: int):
         """
@@ -73,8 +234,216 @@ class RelayBoard:
 
         :param seconds: Whole number of seconds
         """
-        if not (0 <= seconds <= 255):
-            raise ValueError("Delay can be only in range 0-255 seconds")
+        if not (0 <= seconds < len(_DELAY_VALUES)):
+            raise ValueError(_INVALID_SECONDS)
+
+    def _set_timeout_for(self, response_bytes: int):
+        """
+        Set the read timeout of this board on the shared port.
+
+        With `adaptive_timeout` the timeout covers sending the 8 bytes long request, receiving
+        a response of the given length and the silent interval, plus the margin. Otherwise it is
+        `read_timeout`, restored on every call as other boards on the port may change it.
+
+        :param response_bytes: Expected length of the response frame in bytes.
+        """
+        if self._timeout_margin is None:
+            timeout = self._read_timeout
+        else:
+            timeout = (
+                (8 + response_bytes) * self._byte_time
+                + self._silent_3_5
+                + self._timeout_margin
+            )
+        # Assigning the timeout reconfigures an open port, skip it when nothing changes.
+        if self.board.serial.timeout != timeout:
+            self.board.serial.timeout = timeout
+
+    @contextmanager
+    def _transaction(self, response_bytes: int) -> Iterator[None]:
+        """
+        Serialize one request / response on the serial port.
+
+        Holds the lock of the port for `_paced`.
+
+        :param response_bytes: Expected length of the response frame in bytes.
+        """
+        with self._port.lock:
+            with self._paced(response_bytes):
+                yield
+
+    @contextmanager
+    def _paced(self, response_bytes: int) -> Iterator[None]:
+        """
+        Pace one request / response on the serial port, the caller holds the lock of the port.
+
+        Sets the read timeout and waits only for what is left of the 3.5 character
+        silent interval since the end of the previous transaction on the port.
+
+        :param response_bytes: Expected length of the response frame in bytes.
+        """
+        port = self._port
+        self._set_timeout_for(response_bytes)
+        remaining = self._silent_3_5 - (time.monotonic() - port.last_io)
+        if remaining > 0:
+            time.sleep(remaining)
+        try:
+            yield
+        finally:
+            port.last_io = time.monotonic()
+
+    def _send(self, address: int, value: int):
+        """
+        Write command to the register of a channel and drop the cached state.
+
+        :param address: Number of channel, 0 for all channels.
+        :param value: Command value.
+        """
+        with self._transaction(8):
+            self._cache = None
+            self._snapshot = None
+            self._write_fc6(address, value)
+
+    def _write_fc6(self, address: int, value: int, request: Optional[bytes] = None):
+        """
+        Write single register (function code 6) directly on the serial port.
+
+        Skips the generic frame handling of minimalmodbus, the request frame is built
+        with `rtu` and the echo of the board is compared to it. Falls back to
+        minimalmodbus when the port is closed between calls, for debug output and
+        for local echo handling.
+
+        Has to be called inside `self._transaction(8)`.
+
+        :param address: Number of channel, 0 for all channels.
+        :param value: Command value.
+        :param request: Prebuilt request frame for `address` and `value`.
+        :raise NoResponseError: If the board does not answer.
+        :raise InvalidResponseError: If the answer is not an echo of the request.
+        """
+        board = self.board
+        if not self._ser.is_open or board.debug or board.handle_local_echo:
+            self._write(address, value=value, functioncode=6)
+            return
+        if request is None:
+            request = rtu.write_register_frame(self.board.address, address, value)
+        self._exchange_fc6(request)
+
+    def _exchange_fc6(self, request: bytes):
+        """
+        Send prepared write single register request and check the echo.
+
+        The request is not repeated on failure, it may have been executed already
+        (e.g. toggle). Broadcasts (slave address 0) are not answered, so nothing is read.
+
+        :param request: Complete request frame.
+        :raise NoResponseError: If the board does not answer.
+        :raise InvalidResponseError: If the answer is not an echo of the request.
+        """
+        ser = self._ser
+        if self.board.clear_buffers_before_each_transaction:
+            ser.reset_input_buffer()
+        ser.write(request)
+        if request[0] == 0:
+            # Wait until the frame is on the wire, the silent interval counts from its end.
+            ser.flush()
+            return
+        response = ser.read(8)
+        if response == request:
+            return
+        if not response:
+            raise NoResponseError("No communication with the instrument (no answer)")
+        if len(response) == 5 and response[1] == 0x86 and rtu.check_crc(response):
+            raise SlaveReportedException(
+                f"The board reported exception code {response[2]}"
+            )
+        raise InvalidResponseError(
+            f"Response is not an echo of the request: {response!r}"
+        )
+
+    def _fetch_all(self) -> Tuple[bool, ...]:
+        """
+        Read state of all relays from the board.
+
+        Has to be called inside `self._transaction(5 + 2 * self.channels)`.
+
+        Returns the previous tuple itself when the registers did not change,
+        so unchanged polls compare by identity.
+
+        :return: Tuple of booleans of length `self.channels`.
+        """
+        registers = self._read_many(1, number_of_registers=self.channels)
+        if registers == self._last_registers:
+            return self._last_state
+        state = tuple([1 == x for x in registers])
+        self._last_registers = registers
+        self._last_state = state
+        return state
+
+    def _read_all(self) -> Tuple[bool, ...]:
+        """
+        Read state of all relays, served from the polling snapshot or the cache while it is fresh.
+
+        :return: Tuple of booleans of length `self.channels`.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        cache = self._cache
+        if cache is not None and time.monotonic() - cache[0] < self._cache_ttl:
+            return cache[1]
+        with self._transaction(5 + 2 * self.channels):
+            state = self._fetch_all()
+            if self._cache_ttl:
+                self._cache = (time.monotonic(), state)
+        return state
+
+    def _poll(self, interval: float):
+        """
+        Body of the polling thread, refreshes `self._snapshot` every `interval` seconds.
+
+        :param interval: Number of seconds between two reads.
+        """
+        while not self._poll_stop.is_set():
+            try:
+                with self._transaction(5 + 2 * self.channels):
+                    self._snapshot = self._fetch_all()
+            except IOError:
+                logger.warning("Polling relay states failed", exc_info=True)
+                # Let reads go to the board and surface the error instead of stale state.
+                self._snapshot = None
+            self._poll_stop.wait(interval)
+
+    def start_polling(self, interval: float):
+        """
+        Start a background thread reading state of all relays every `interval` seconds.
+
+        While polling, `read_relay`, `read_relays` and `read_all_relays` return the last polled
+        state without touching the serial port. Commands sent to the board drop the polled
+        state, so reads never return state older than the last command.
+        A failed poll drops the polled state too, reads then go to the board and raise its error.
+
+        :param interval: Number of seconds between two reads.
+        :raise RuntimeError: If polling is already running.
+        """
+        if self._poll_thread is not None:
+            raise RuntimeError("Polling is already running.")
+        self._poll_stop.clear()
+        self._poll_thread = threading.Thread(
+            target=self._poll, args=(interval,), name="RelayBoardPoller", daemon=True
+        )
+        self._poll_thread.start()
+
+    def stop_polling(self):
+        """
+        Stop the background polling thread started by `start_polling`.
+        """
+        if self._poll_thread is None:
+            return
+        self._poll_stop.set()
+        self._poll_thread.join()
+        self._poll_thread = None
+        self._snapshot = None
 
     def open_relay(self, channel: int):
         """
@@ -82,12 +451,15 @@ class RelayBoard:
 
         :param channel: Number of channel.
         """
-        logger.info(
-            f"Opening relay {channel}",
-            extra={"channel": channel, "state": True, "action": "open"},
-        )
-        self.check_channel_number(channel)
-        self.board.write_register(channel, value=0x0100, functioncode=6)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Opening relay %d",
+                channel,
+                extra={"channel": channel, **_ACTION_EXTRAS["open"]},
+            )
+        if not isinstance(channel, int) or channel not in self._channel_range:
+            raise ValueError(_INVALID_CHANNEL)
+        self._send(channel, _OPEN)
 
     def close_relay(self, channel: int):
         """
@@ -95,12 +467,15 @@ class RelayBoard:
 
         :param channel: Number of channel.
         """
-        logger.info(
-            f"Closing relay {channel}",
-            extra={"channel": channel, "state": False, "action": "close"},
-        )
-        self.check_channel_number(channel)
-        self.board.write_register(channel, value=0x0200, functioncode=6)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Closing relay %d",
+                channel,
+                extra={"channel": channel, **_ACTION_EXTRAS["close"]},
+            )
+        if not isinstance(channel, int) or channel not in self._channel_range:
+            raise ValueError(_INVALID_CHANNEL)
+        self._send(channel, _CLOSE)
 
     def set_relay(self, channel: int, state: bool):
         """
@@ -111,10 +486,98 @@ class RelayBoard:
         :param channel: Number of channel.
         :param state: Bool state
         """
-        if state:
-            self.open_relay(channel)
-        else:
-            self.close_relay(channel)
+        self._setters[bool(state)](channel)
+
+    def set_relays(self, states: Dict[int, bool]):
+        """
+        Set state of multiple relays at once.
+
+        Consecutive channels are written in a single transaction (function code 16),
+        standalone channels fall back to a single register write (function code 6).
+
+        True means "Open" / High to relay state.
+
+        :param states: Dictionary mapping number of channel to bool state.
+        """
+        if not states:
+            return
+        if not all(isinstance(channel, int) for channel in states):
+            raise ValueError(_INVALID_CHANNEL)
+        if not (1 <= min(states) and max(states) <= self.channels):
+            raise ValueError(_INVALID_CHANNEL)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Setting relays %s", states, extra=_ACTION_EXTRAS["multi_set"])
+
+        channels = sorted(states)
+        run_start = 0
+        for i in range(1, len(channels) + 1):
+            if i < len(channels) and channels[i] == channels[i - 1] + 1:
+                continue
+            run = channels[run_start:i]
+            values = [_OPEN if states[channel] else _CLOSE for channel in run]
+            if len(run) == 1:
+                self._send(run[0], values[0])
+            else:
+                with self._transaction(8):
+                    self._cache = None
+                    self._snapshot = None
+                    self.board.write_registers(run[0], values)
+            run_start = i
+
+    def execute_sequence(self, ops: Sequence[Tuple]):
+        """
+        Execute a sequence of commands back to back.
+
+        The whole sequence is checked and all frames are built before the first command
+        is sent. The port is held for the whole sequence, so commands of other boards or
+        threads can not interleave, commands are separated only by the RTU silent interval.
+
+        Operations are tuples of the action name and its arguments:
+        `("open", channel)`, `("close", channel)`, `("toggle", channel)`,
+        `("latch", channel)`, `("momentary", channel)`, `("delay", channel, seconds)`,
+        `("open_all",)` and `("close_all",)`.
+
+        :param ops: Sequence of operations.
+        :raise ValueError: If any of the operations is invalid, nothing is sent then.
+        """
+        slave = self.board.address
+        frames = []
+        for op in ops:
+            if not op:
+                raise ValueError(f"Invalid operation {op!r}.")
+            action = op[0]
+            if action not in _ACTION:
+                raise ValueError(f"Unknown action {action!r}.")
+            if action in ("open_all", "close_all"):
+                if len(op) != 1:
+                    raise ValueError(f"Invalid operation {op!r}.")
+                address, value = 0, _ACTION[action]
+            else:
+                if len(op) != (3 if action == "delay" else 2):
+                    raise ValueError(f"Invalid operation {op!r}.")
+                address = op[1]
+                if not isinstance(address, int) or address not in self._channel_range:
+                    raise ValueError(_INVALID_CHANNEL)
+                if action == "delay":
+                    seconds = op[2]
+                    if not isinstance(seconds, int):
+                        raise ValueError(f"Invalid operation {op!r}.")
+                    if not (0 <= seconds < len(_DELAY_VALUES)):
+                        raise ValueError(_INVALID_SECONDS)
+                    value = _DELAY_VALUES[seconds]
+                else:
+                    value = _ACTION[action]
+            request = rtu.write_register_frame(slave, address, value)
+            frames.append((address, value, request))
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Executing sequence %r", ops, extra=_ACTION_EXTRAS["sequence"])
+        with self._port.lock:
+            for address, value, request in frames:
+                with self._paced(8):
+                    self._cache = None
+                    self._snapshot = None
+                    self._write_fc6(address, value, request)
 
     def toggle(self, channel: int):
         """
@@ -122,12 +585,15 @@ class RelayBoard:
 
         :param channel: Number of channel.
         """
-        logger.info(
-            f"Toggling relay {channel}",
-            extra={"channel": channel, "state": None, "action": "toggle"},
-        )
-        self.check_channel_number(channel)
-        self.board.write_register(channel, value=0x0300, functioncode=6)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Toggling relay %d",
+                channel,
+                extra={"channel": channel, **_ACTION_EXTRAS["toggle"]},
+            )
+        if not isinstance(channel, int) or channel not in self._channel_range:
+            raise ValueError(_INVALID_CHANNEL)
+        self._send(channel, _TOGGLE)
 
     def latch(self, channel: int):
         """
@@ -137,12 +603,15 @@ class RelayBoard:
 
         :param channel: Number of channel.
         """
-        logger.info(
-            f"Latching relay {channel}",
-            extra={"channel": channel, "state": None, "action": "latch"},
-        )
-        self.check_channel_number(channel)
-        self.board.write_register(channel, value=0x0400, functioncode=6)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Latching relay %d",
+                channel,
+                extra={"channel": channel, **_ACTION_EXTRAS["latch"]},
+            )
+        if not isinstance(channel, int) or channel not in self._channel_range:
+            raise ValueError(_INVALID_CHANNEL)
+        self._send(channel, _LATCH)
 
     def momentary(self, channel: int):
         """
@@ -152,17 +621,15 @@ class RelayBoard:
 
         :param channel: Number of channel.
         """
-        logger.info(
-            f"Momentary closing relay {channel}",
-            extra={
-                "channel": channel,
-                "state": True,
-                "action": "momentary_close",
-                "time": 1,
-            },
-        )
-        self.check_channel_number(channel)
-        self.board.write_register(channel, value=0x0500, functioncode=6)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Momentary closing relay %d",
+                channel,
+                extra={"channel": channel, **_ACTION_EXTRAS["momentary"]},
+            )
+        if not isinstance(channel, int) or channel not in self._channel_range:
+            raise ValueError(_INVALID_CHANNEL)
+        self._send(channel, _MOMENTARY)
 
     def delay(self, channel: int, seconds: int):
         """
@@ -175,38 +642,34 @@ class RelayBoard:
         :param channel: Number of channel.
         :param seconds: Number of seconds to close the relay for
         """
-        logger.info(
-            f"Delay close relay {channel} for {seconds}s",
-            extra={
-                "channel": channel,
-                "state": True,
-                "action": "delay_close",
-                "time": seconds,
-            },
-        )
-        self.check_channel_number(channel)
-        self.check_seconds(seconds)
-        self.board.write_register(channel, value=(0x06 << 8) + seconds, functioncode=6)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Delay close relay %d for %ds",
+                channel,
+                seconds,
+                extra={"channel": channel, "time": seconds, **_ACTION_EXTRAS["delay"]},
+            )
+        if not isinstance(channel, int) or channel not in self._channel_range:
+            raise ValueError(_INVALID_CHANNEL)
+        if not (0 <= seconds < len(_DELAY_VALUES)):
+            raise ValueError(_INVALID_SECONDS)
+        self._send(channel, _DELAY_VALUES[seconds])
 
     def open_all(self):
         """
         Open all relays.
         """
-        logger.info(
-            f"Opening all relays",
-            extra={"channel": -1, "state": True, "action": "all_open"},
-        )
-        self.board.write_register(0, value=0x0700, functioncode=6)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Opening all relays", extra=_ACTION_EXTRAS["open_all"])
+        self._send(0, _OPEN_ALL)
 
     def close_all(self):
         """
         Close all relays.
         """
-        logger.info(
-            f"Closing all relays",
-            extra={"channel": -1, "state": False, "action": "all_close"},
-        )
-        self.board.write_register(0, value=0x0800, functioncode=6)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Closing all relays", extra=_ACTION_EXTRAS["close_all"])
+        self._send(0, _CLOSE_ALL)
 
     def read_relay(self, channel: int) -> bool:
         """
@@ -217,12 +680,18 @@ class RelayBoard:
         :param channel: Number of channel.
         :return: Bool
         """
-        logger.info(
-            f"Reading relay {channel} state",
-            extra={"channel": channel, "state": False, "action": "read"},
-        )
-        self.check_channel_number(channel)
-        return 1 == self.board.read_register(channel)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Reading relay %d state",
+                channel,
+                extra={"channel": channel, **_ACTION_EXTRAS["read"]},
+            )
+        if not isinstance(channel, int) or channel not in self._channel_range:
+            raise ValueError(_INVALID_CHANNEL)
+        if self._cache_ttl or self._poll_thread is not None:
+            return self._read_all()[channel - 1]
+        with self._transaction(7):
+            return 1 == self._read(channel)
 
     def read_relays(self, start_channel: int, length: int) -> Tuple[bool]:
         """
@@ -232,19 +701,27 @@ class RelayBoard:
         :param length: Number of relays to read.
         :return: Tuple of booleans of length n(length).
         """
-        logger.info(
-            f"Reading {length} relays state starting from {start_channel}",
-            extra={"channel": "-2", "state": False, "action": "more_read"},
-        )
-        self.check_channel_number(start_channel)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Reading %d relays state starting from %d",
+                length,
+                start_channel,
+                extra=_ACTION_EXTRAS["more_read"],
+            )
+        if (
+            not isinstance(start_channel, int)
+            or start_channel not in self._channel_range
+        ):
+            raise ValueError(_INVALID_CHANNEL)
         if self.channels - start_channel + 1 < length:
             raise ValueError("Invalid length.")
-        return tuple(
-            1 == x
-            for x in self.board.read_registers(
-                start_channel, number_of_registers=length
-            )
-        )
+        if self._cache_ttl or self._poll_thread is not None:
+            return self._read_all()[start_channel - 1 : start_channel - 1 + length]
+        with self._transaction(5 + 2 * length):
+            if length == self.channels:
+                return self._fetch_all()
+            registers = self._read_many(start_channel, number_of_registers=length)
+        return tuple([1 == x for x in registers])
 
     def read_all_relays(self) -> Tuple[bool]:
         """
@@ -253,3 +730,46 @@ class RelayBoard:
         :return: Tuple of booleans of length `self.channels`.
         """
         return self.read_relays(1, self.channels)
+
+    def close(self):
+        """
+        Stop polling and close the serial port.
+
+        The port is shared with other boards opened on the same port name.
+        """
+        self.stop_polling()
+        with self._lock:
+            self.board.serial.close()
+
+    def __enter__(self) -> "RelayBoard":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def read_all_boards(boards: Sequence[RelayBoard]) -> List[Tuple[bool, ...]]:
+    """
+    Read state of all relays of several boards sharing one serial port.
+
+    The reads run back to back, separated only by what is left of the 3.5 character
+    silent interval since the end of the previous board's transaction.
+
+    :param boards: Boards on the same serial port, each with its own slave address.
+    :return: Tuple of booleans of length `board.channels` for each board.
+    :raise ValueError: If the boards do not share one serial port.
+    """
+    if not boards:
+        return []
+    serial = boards[0].board.serial
+    if any(board.board.serial is not serial for board in boards):
+        raise ValueError("Boards have to share one serial port.")
+
+    states = []
+    for board in boards:
+        with board._transaction(5 + 2 * board.channels):
+            state = board._fetch_all()
+            if board._cache_ttl:
+                board._cache = (time.monotonic(), state)
+        states.append(state)
+    return states
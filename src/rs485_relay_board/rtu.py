@@ -0,0 +1,97 @@
+"""Modbus RTU framing for the function codes used by the relay boards."""
+
+import struct
+from typing import List
+
+
+def _make_crc_table() -> List[int]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC_TABLE = tuple(_make_crc_table())
+_REQUEST = struct.Struct(">BBHH")
+_CRC = struct.Struct("<H")
+
+
+def crc16(data: bytes) -> int:
+    """
+    Compute Modbus CRC16 of data.
+
+    :param data: Frame without CRC.
+    :return: CRC as integer, to be appended little endian.
+    """
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ _CRC_TABLE[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def check_crc(frame: bytes) -> bool:
+    """
+    Check CRC of a complete frame.
+
+    :param frame: Frame including the trailing CRC.
+    :return: True if the CRC matches.
+    """
+    return (
+        len(frame) > 2
+        and crc16(frame[:-2]) == _CRC.unpack_from(frame, len(frame) - 2)[0]
+    )
+
+
+def _frame(slaveaddress: int, functioncode: int, address: int, value: int) -> bytes:
+    request = _REQUEST.pack(slaveaddress, functioncode, address, value)
+    return request + _CRC.pack(crc16(request))
+
+
+def write_register_frame(slaveaddress: int, address: int, value: int) -> bytes:
+    """
+    Build write single register (function code 6) request.
+
+    The board answers with an echo of the request.
+
+    :param slaveaddress: Slave address in the range 0 to 247.
+    :param address: Register address.
+    :param value: Register value.
+    :return: 8 bytes long frame.
+    """
+    return _frame(slaveaddress, 6, address, value)
+
+
+def read_registers_frame(slaveaddress: int, address: int, count: int) -> bytes:
+    """
+    Build read holding registers (function code 3) request.
+
+    The response is `5 + 2 * count` bytes long.
+
+    :param slaveaddress: Slave address in the range 0 to 247.
+    :param address: Address of the first register.
+    :param count: Number of registers.
+    :return: 8 bytes long frame.
+    """
+    return _frame(slaveaddress, 3, address, count)
+
+
+def parse_read_registers_response(
+    slaveaddress: int, count: int, response: bytes
+) -> List[int]:
+    """
+    Check read holding registers (function code 3) response and return its values.
+
+    :param slaveaddress: Slave address the request was sent to.
+    :param count: Number of registers requested.
+    :param response: Complete response frame.
+    :return: List of register values.
+    :raise ValueError: If the response is malformed.
+    """
+    if len(response) != 5 + 2 * count or not check_crc(response):
+        raise ValueError("Invalid CRC or length of the response.")
+    if response[0] != slaveaddress or response[1] != 3 or response[2] != 2 * count:
+        raise ValueError("Unexpected header of the response.")
+    return list(struct.unpack_from(f">{count}H", response, 3))
@@ -0,0 +1,91 @@
+import pytest
+
+from rs485_relay_board import rtu
+
+
+def test_crc16_known_vector():
+    # Read 10 holding registers from slave 1, CRC is sent little endian as C5 CD.
+    assert rtu.crc16(bytes.fromhex("01030000000a")) == 0xCDC5
+
+
+def test_crc16_empty():
+    assert rtu.crc16(b"") == 0xFFFF
+
+
+def test_read_registers_frame():
+    assert rtu.read_registers_frame(1, 0, 10) == bytes.fromhex("01030000000ac5cd")
+
+
+def test_write_register_frame():
+    # Open channel 1 of the board on slave 1.
+    assert rtu.write_register_frame(1, 1, 0x0100) == bytes.fromhex("010600010100d99a")
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        rtu.write_register_frame(1, 1, 0x0100),
+        rtu.write_register_frame(247, 16, 0x0800),
+        rtu.read_registers_frame(0x1F, 1, 16),
+        bytes.fromhex("01030200017984"),
+    ],
+)
+def test_check_crc_valid(frame):
+    assert rtu.check_crc(frame)
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        bytes.fromhex("010600010100d99b"),
+        bytes.fromhex("010600010101d99a"),
+        bytes.fromhex("0106"),
+        b"",
+    ],
+)
+def test_check_crc_invalid(frame):
+    assert not rtu.check_crc(frame)
+
+
+def _response(slaveaddress, values):
+    data = bytes([slaveaddress, 3, 2 * len(values)])
+    data += b"".join(value.to_bytes(2, "big") for value in values)
+    return data + rtu.crc16(data).to_bytes(2, "little")
+
+
+def test_parse_read_registers_response_known_vector():
+    response = bytes.fromhex("01030200017984")
+    assert rtu.parse_read_registers_response(1, 1, response) == [1]
+
+
+def test_parse_read_registers_response_round_trip():
+    values = [1, 0, 0, 1, 0xFFFF, 0x1234]
+    response = _response(2, values)
+    assert rtu.parse_read_registers_response(2, len(values), response) == values
+
+
+def test_parse_read_registers_response_bad_crc():
+    response = bytearray(_response(1, [1, 0]))
+    response[-1] ^= 0xFF
+    with pytest.raises(ValueError):
+        rtu.parse_read_registers_response(1, 2, bytes(response))
+
+
+def test_parse_read_registers_response_bad_length():
+    with pytest.raises(ValueError):
+        rtu.parse_read_registers_response(1, 3, _response(1, [1, 0]))
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        # Other slave.
+        _response(2, [1, 0]),
+        # Other function code.
+        bytes.fromhex("01040400010000")
+        + rtu.crc16(bytes.fromhex("01040400010000")).to_bytes(2, "little"),
+    ],
+)
+def test_parse_read_registers_response_bad_header(response):
+    with pytest.raises(ValueError):
+        rtu.parse_read_registers_response(1, 2, response)